@@ -1,8 +1,7 @@
 import numpy as np
-import skfuzzy as fuzz
-from skfuzzy import control as ctrl
 import streamlit as st
-import matplotlib.pyplot as plt
+from PIL import Image, ImageDraw
+from inference import build_lut, lut_index, slider_ranges, temperature_mfs, humidity_mfs, occupancy_mfs, cooling_mfs
 
 # Set page configuration
 st.set_page_config(
@@ -19,57 +18,103 @@ based on temperature, humidity, and room occupancy inputs. Adjust the sliders to
 cooling level changes with different environmental conditions.
 """)
 
-# Create the fuzzy logic control system
-def create_fuzzy_system():
-    # Define input variables
-    temperature = ctrl.Antecedent(np.arange(15, 35, 1), 'temperature')
-    humidity = ctrl.Antecedent(np.arange(30, 80, 1), 'humidity')
-    occupancy = ctrl.Antecedent(np.arange(0, 21, 1), 'occupancy')
-    cooling = ctrl.Consequent(np.arange(0, 100, 1), 'cooling')
-
-    # Define membership functions for temperature
-    temperature['cold'] = fuzz.trimf(temperature.universe, [15, 15, 20])
-    temperature['moderate'] = fuzz.trimf(temperature.universe, [18, 25, 28])
-    temperature['hot'] = fuzz.trimf(temperature.universe, [25, 35, 35])
-
-    # Define membership functions for humidity
-    humidity['low'] = fuzz.trimf(humidity.universe, [30, 30, 50])
-    humidity['medium'] = fuzz.trimf(humidity.universe, [40, 60, 60])
-    humidity['high'] = fuzz.trimf(humidity.universe, [60, 80, 80])
-    
-    # Define membership functions for occupancy
-    occupancy['low'] = fuzz.trimf(occupancy.universe, [0, 0, 5])
-    occupancy['medium'] = fuzz.trimf(occupancy.universe, [3, 8, 12])
-    occupancy['high'] = fuzz.trimf(occupancy.universe, [10, 20, 20])
-
-    # Define membership functions for cooling
-    cooling['low'] = fuzz.trimf(cooling.universe, [0, 0, 30])
-    cooling['medium'] = fuzz.trimf(cooling.universe, [20, 50, 60])
-    cooling['high'] = fuzz.trimf(cooling.universe, [50, 100, 100])
-
-    # Define fuzzy rules
-    rule1 = ctrl.Rule(temperature['cold'] | humidity['low'], cooling['low'])
-    rule2 = ctrl.Rule(temperature['moderate'] & humidity['medium'] & occupancy['low'], cooling['low'])
-    rule3 = ctrl.Rule(temperature['moderate'] & humidity['medium'] & occupancy['medium'], cooling['medium'])
-    rule4 = ctrl.Rule(temperature['hot'] | humidity['high'], cooling['high'])
-    rule5 = ctrl.Rule(occupancy['high'], cooling['high'])
-
-    # Create control system
-    cooling_ctrl = ctrl.ControlSystem([rule1, rule2, rule3, rule4, rule5])
-    return ctrl.ControlSystemSimulation(cooling_ctrl), temperature, humidity, occupancy, cooling
+# Plot points of triangular membership functions, one row per (a, b, c).
+# The functions are piecewise linear, so their vertices (plus the zero tails
+# out to the plot range) draw them exactly; a == b or b == c is a shoulder at
+# membership 1 that drops vertically unless it sits on the plot edge
+def _tri_knots(abc, xlim):
+    a, b, c = np.asarray(abc, dtype=float).T
+    lo, hi = xlim
+    at_a = np.where(a == b, 1.0, 0.0)
+    at_c = np.where(c == b, 1.0, 0.0)
+    left = np.where(a > lo, 0.0, at_a)
+    right = np.where(c < hi, 0.0, at_c)
+    xs = np.stack([np.full_like(a, lo), a, a, b, c, c, np.full_like(c, hi)], axis=1)
+    ys = np.stack([left, left, at_a, np.ones_like(b), at_c, right, right], axis=1)
+    return xs, ys
+
+# Membership plot panels: (variable, term labels, title, x-limits, x-label)
+membership_panels = [
+    ('temperature', ['cold', 'moderate', 'hot'], 'Temperature Membership', (15, 35), 'Temperature (°C)'),
+    ('humidity', ['low', 'medium', 'high'], 'Humidity Membership', (30, 80), 'Humidity (%)'),
+    ('occupancy', ['low', 'medium', 'high'], 'Occupancy Membership', (0, 20), 'Number of People'),
+    ('cooling', ['low', 'medium', 'high'], 'Cooling Membership', (0, 100), 'Cooling Level'),
+]
+
+# Compute the static membership function curves once for plotting
+@st.cache_data
+def mf_curves():
+    mfs = dict(temperature=temperature_mfs, humidity=humidity_mfs,
+               occupancy=occupancy_mfs, cooling=cooling_mfs)
+    return {name: _tri_knots(mfs[name], xlim) for name, _, _, xlim, _ in membership_panels}
+
+# Render custom membership function plots rather than using the built-in
+# view() method, as one figure with a subplot per variable. The figure is
+# drawn straight onto an Agg canvas, bypassing pyplot and PNG encoding, once
+# per process. The value markers are left out and drawn onto the image per
+# rerun, so the pixel box and x-limits of each subplot are returned
+@st.cache_resource
+def membership_image():
+    # Matplotlib is slow to import and only needed once the plots are shown
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    curves = mf_curves()
+    fig = Figure(figsize=(8, 12))
+    canvas = FigureCanvasAgg(fig)
+    axes = fig.subplots(len(membership_panels), 1)
+
+    for ax, (name, labels, title, xlim, xlabel) in zip(axes, membership_panels):
+        # Plot all membership functions in one call, one column per function
+        xs, ys = curves[name]
+        lines = ax.plot(xs.T, ys.T, linewidth=1.5)
+        for line, label, color in zip(lines, labels, ['b', 'g', 'r']):
+            line.set(color=color, label=label)
+
+        ax.set_title(title)
+        ax.legend(loc='center right')
+        ax.set_ylim(-0.1, 1.1)
+        ax.set_xlim(*xlim)
+        ax.set_ylabel('Membership')
+        ax.set_xlabel(xlabel)
+        ax.grid(True)
+    fig.tight_layout()
+
+    # Axes corners in image pixels (display coordinates have y pointing up)
+    height = fig.bbox.height
+    boxes = []
+    for ax, (_, _, _, xlim, _) in zip(axes, membership_panels):
+        (left, bottom), (right, top) = ax.transAxes.transform([(0, 0), (1, 1)])
+        boxes.append(((left, height - top, right, height - bottom), xlim))
+
+    canvas.draw()
+    image = Image.frombytes('RGBA', canvas.get_width_height(), bytes(canvas.buffer_rgba()))
+    return image, boxes
+
+# Draw the dotted value markers onto a copy of the cached membership plots
+def draw_markers(plot, values):
+    image, boxes = plot
+    image = image.copy()
+    draw = ImageDraw.Draw(image)
+    for ((left, top, right, bottom), (lo, hi)), value in zip(boxes, values):
+        x = round(left + (value - lo) / (hi - lo) * (right - left))
+        for y in range(round(top), round(bottom), 5):
+            draw.line([(x, y), (x, min(y + 2, bottom))], fill='black', width=2)
+    return image
+
+# Precompute the cooling level for every slider combination once per process
+@st.cache_resource
+def cooling_lut():
+    return build_lut()
 
 # Create sidebar for inputs
 st.sidebar.header("Input Parameters")
-temp_value = st.sidebar.slider("Temperature (°C)", 15, 35, 28, 1)
-humidity_value = st.sidebar.slider("Humidity (%)", 30, 80, 65, 1)
-occupancy_value = st.sidebar.slider("Room Occupancy (people)", 0, 20, 5, 1)
+temp_value = st.sidebar.slider("Temperature (°C)", *slider_ranges['temperature'], 28, 1)
+humidity_value = st.sidebar.slider("Humidity (%)", *slider_ranges['humidity'], 65, 1)
+occupancy_value = st.sidebar.slider("Room Occupancy (people)", *slider_ranges['occupancy'], 5, 1)
 
-# Create and compute the fuzzy system
-cooling_sim, temperature, humidity, occupancy, cooling = create_fuzzy_system()
-cooling_sim.input['temperature'] = temp_value
-cooling_sim.input['humidity'] = humidity_value
-cooling_sim.input['occupancy'] = occupancy_value
-cooling_sim.compute()
+# Look up the fuzzy system output
+cooling_level = float(cooling_lut()[lut_index(temp_value, humidity_value, occupancy_value)])
 
 # Display the result
 col1, col2 = st.columns(2)
@@ -81,7 +126,6 @@ with col1:
     st.info(f"Room Occupancy: {occupancy_value} people")
     
     st.subheader("Output Result")
-    cooling_level = cooling_sim.output['cooling']
     st.success(f"Recommended Cooling Level: {cooling_level:.2f}/100")
     
     # Visual indicator
@@ -97,95 +141,13 @@ with col1:
 
 with col2:
     st.subheader("Fuzzy Logic Visualization")
-    
-    # Create custom membership function plots rather than using the built-in view() method
-    # Temperature membership plot
-    fig1, ax1 = plt.subplots(figsize=(8, 3))
-    x_temp = np.arange(15, 35, 0.1)
-    
-    # Plot each membership function
-    ax1.plot(x_temp, fuzz.trimf(x_temp, [15, 15, 20]), 'b', linewidth=1.5, label='cold')
-    ax1.plot(x_temp, fuzz.trimf(x_temp, [18, 25, 28]), 'g', linewidth=1.5, label='moderate')
-    ax1.plot(x_temp, fuzz.trimf(x_temp, [25, 35, 35]), 'r', linewidth=1.5, label='hot')
-    
-    # Fill current temperature value
-    ax1.fill_between([temp_value, temp_value], [0, 1], alpha=0.2)
-    ax1.plot([temp_value, temp_value], [0, 1], 'k:', linewidth=1.5)
-    
-    ax1.set_title('Temperature Membership')
-    ax1.legend(loc='center right')
-    ax1.set_ylim(-0.1, 1.1)
-    ax1.set_xlim(15, 35)
-    ax1.set_ylabel('Membership')
-    ax1.set_xlabel('Temperature (°C)')
-    ax1.grid(True)
-    st.pyplot(fig1)
-    
-    # Humidity membership plot
-    fig2, ax2 = plt.subplots(figsize=(8, 3))
-    x_humid = np.arange(30, 80, 0.1)
-    
-    # Plot each membership function
-    ax2.plot(x_humid, fuzz.trimf(x_humid, [30, 30, 50]), 'b', linewidth=1.5, label='low')
-    ax2.plot(x_humid, fuzz.trimf(x_humid, [40, 60, 60]), 'g', linewidth=1.5, label='medium')
-    ax2.plot(x_humid, fuzz.trimf(x_humid, [60, 80, 80]), 'r', linewidth=1.5, label='high')
-    
-    # Fill current humidity value
-    ax2.fill_between([humidity_value, humidity_value], [0, 1], alpha=0.2)
-    ax2.plot([humidity_value, humidity_value], [0, 1], 'k:', linewidth=1.5)
-    
-    ax2.set_title('Humidity Membership')
-    ax2.legend(loc='center right')
-    ax2.set_ylim(-0.1, 1.1)
-    ax2.set_xlim(30, 80)
-    ax2.set_ylabel('Membership')
-    ax2.set_xlabel('Humidity (%)')
-    ax2.grid(True)
-    st.pyplot(fig2)
-    
-    # Occupancy membership plot
-    fig3, ax3 = plt.subplots(figsize=(8, 3))
-    x_occ = np.arange(0, 21, 0.1)
-    
-    # Plot each membership function
-    ax3.plot(x_occ, fuzz.trimf(x_occ, [0, 0, 5]), 'b', linewidth=1.5, label='low')
-    ax3.plot(x_occ, fuzz.trimf(x_occ, [3, 8, 12]), 'g', linewidth=1.5, label='medium')
-    ax3.plot(x_occ, fuzz.trimf(x_occ, [10, 20, 20]), 'r', linewidth=1.5, label='high')
-    
-    # Fill current occupancy value
-    ax3.fill_between([occupancy_value, occupancy_value], [0, 1], alpha=0.2)
-    ax3.plot([occupancy_value, occupancy_value], [0, 1], 'k:', linewidth=1.5)
-    
-    ax3.set_title('Occupancy Membership')
-    ax3.legend(loc='center right')
-    ax3.set_ylim(-0.1, 1.1)
-    ax3.set_xlim(0, 20)
-    ax3.set_ylabel('Membership')
-    ax3.set_xlabel('Number of People')
-    ax3.grid(True)
-    st.pyplot(fig3)
-    
-    # Cooling membership plot
-    fig4, ax4 = plt.subplots(figsize=(8, 3))
-    x_cool = np.arange(0, 100, 0.1)
-    
-    # Plot each membership function
-    ax4.plot(x_cool, fuzz.trimf(x_cool, [0, 0, 30]), 'b', linewidth=1.5, label='low')
-    ax4.plot(x_cool, fuzz.trimf(x_cool, [20, 50, 60]), 'g', linewidth=1.5, label='medium')
-    ax4.plot(x_cool, fuzz.trimf(x_cool, [50, 100, 100]), 'r', linewidth=1.5, label='high')
-    
-    # Fill current output value
-    ax4.fill_between([cooling_level, cooling_level], [0, 1], alpha=0.2)
-    ax4.plot([cooling_level, cooling_level], [0, 1], 'k:', linewidth=1.5)
-    
-    ax4.set_title('Cooling Membership')
-    ax4.legend(loc='center right')
-    ax4.set_ylim(-0.1, 1.1)
-    ax4.set_xlim(0, 100)
-    ax4.set_ylabel('Membership')
-    ax4.set_xlabel('Cooling Level')
-    ax4.grid(True)
-    st.pyplot(fig4)
+
+    # Streamlit runs the body of a collapsed expander too, so the plots are
+    # gated by a checkbox to keep them off the default interaction path
+    if st.checkbox("Show membership functions", value=False):
+        # Mark the current values on the pre-rendered membership plots
+        st.image(draw_markers(membership_image(),
+                              [temp_value, humidity_value, occupancy_value, cooling_level]))
 
 # Add explanation section
 st.subheader("How It Works")
@@ -209,4 +171,4 @@ Each input can partially belong to multiple categories (e.g., a temperature can
 
 # Footer
 st.markdown("---")
-st.caption("Fuzzy Logic Cooling Control System - Powered by scikit-fuzzy and Streamlit")
\ No newline at end of file
+st.caption("Fuzzy Logic Cooling Control System - Powered by NumPy, Matplotlib and Streamlit")
\ No newline at end of file
@@ -0,0 +1,286 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the kernel runs as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Membership function (a, b, c) vertices per variable, in term order
+temperature_mfs = [[15, 15, 20], [18, 25, 28], [25, 35, 35]]
+humidity_mfs = [[30, 30, 50], [40, 60, 60], [60, 80, 80]]
+occupancy_mfs = [[0, 0, 5], [3, 8, 12], [10, 20, 20]]
+cooling_mfs = [[0, 0, 30], [20, 50, 60], [50, 100, 100]]
+
+# Rows of (b, 1 / (b - a), 1 / (c - b)) for the branchless tri(); a shoulder
+# (a == b or b == c) gets a near-vertical edge instead of a division by zero
+def _tri_params(mfs):
+    params = np.empty((len(mfs), 3), dtype=np.float64)
+    for i, (a, b, c) in enumerate(mfs):
+        params[i] = b, 1.0 / max(b - a, 1e-12), 1.0 / max(c - b, 1e-12)
+    return params
+
+temperature_params = _tri_params(temperature_mfs)
+humidity_params = _tri_params(humidity_mfs)
+occupancy_params = _tri_params(occupancy_mfs)
+cooling_params = _tri_params(cooling_mfs)
+
+# centroid() only subtracts pairwise overlaps of the cooling sets, which is
+# exact only while 'low' and 'high' do not overlap
+if cooling_mfs[0][2] > cooling_mfs[2][0]:
+    raise ValueError("cooling 'low' and 'high' membership functions must not overlap")
+
+# Triangular membership function without branches; the ramps are measured
+# from the peak b so both equal 1 there, even at a shoulder
+@njit(cache=True, fastmath=True)
+def tri(x, params):
+    b, inv_ba, inv_cb = params[0], params[1], params[2]
+    return max(0.0, min(1.0 + (x - b) * inv_ba, 1.0 + (b - x) * inv_cb, 1.0))
+
+# Input variables: (name, slider range, clipping range, term names, membership
+# functions). Inputs are clipped to the integer universes the original
+# scikit-fuzzy system sampled, so the slider maxima evaluate as 34 and 79
+input_variables = [
+    ('temperature', (15, 35), (15, 34), ['cold', 'moderate', 'hot'], temperature_mfs),
+    ('humidity', (30, 80), (30, 79), ['low', 'medium', 'high'], humidity_mfs),
+    ('occupancy', (0, 20), (0, 20), ['low', 'medium', 'high'], occupancy_mfs),
+]
+slider_ranges = {name: slider for name, slider, _, _, _ in input_variables}
+cooling_terms = ['low', 'medium', 'high']
+
+# Rule base: (connective, [(variable, term), ...], cooling term)
+rules = [
+    ('or', [('temperature', 'cold'), ('humidity', 'low')], 'low'),
+    ('and', [('temperature', 'moderate'), ('humidity', 'medium'), ('occupancy', 'low')], 'low'),
+    ('and', [('temperature', 'moderate'), ('humidity', 'medium'), ('occupancy', 'medium')], 'medium'),
+    ('or', [('temperature', 'hot'), ('humidity', 'high')], 'high'),
+    ('and', [('occupancy', 'high')], 'high'),
+]
+
+# Generate straight-line source for the static rule base: every membership
+# degree is a branchless tri() with its parameters folded in as literals,
+# followed by the min/max rule combinators and one max per cooling term
+def _generate_fire_source():
+    lines = ['def fire(temperature, humidity, occupancy):']
+    for name, _, (lo, hi), terms, mfs in input_variables:
+        lines.append(f'    {name} = min(max({name}, {float(lo)!r}), {float(hi)!r})')
+        for term, params in zip(terms, _tri_params(mfs)):
+            b, inv_ba, inv_cb = (float(p) for p in params)
+            lines.append(f'    {name}_{term} = max(0.0, min(1.0 + ({name} - {b!r}) * {inv_ba!r}, '
+                         f'1.0 + ({b!r} - {name}) * {inv_cb!r}, 1.0))')
+
+    cuts = {term: [] for term in cooling_terms}
+    for i, (connective, antecedents, consequent) in enumerate(rules, 1):
+        degrees = [f'{name}_{term}' for name, term in antecedents]
+        if len(degrees) == 1:
+            lines.append(f'    rule{i} = {degrees[0]}')
+        else:
+            combinator = 'max' if connective == 'or' else 'min'
+            lines.append(f'    rule{i} = {combinator}({", ".join(degrees)})')
+        cuts[consequent].append(f'rule{i}')
+
+    returned = []
+    for term in cooling_terms:
+        if not cuts[term]:
+            returned.append('0.0')
+        elif len(cuts[term]) == 1:
+            returned.append(cuts[term][0])
+        else:
+            returned.append(f'max({", ".join(cuts[term])})')
+    lines.append(f'    return {", ".join(returned)}')
+    return '\n'.join(lines) + '\n'
+
+# Compile the generated rule evaluation; returns the cut (firing strength) of
+# each cooling term. Generated code has no source file, so it is not cached
+fire_source = _generate_fire_source()
+_namespace = {}
+exec(compile(fire_source, '<fuzzy rules>', 'exec'), _namespace)
+fire = njit(fastmath=True)(_namespace['fire'])
+
+# Area and first moment of a triangle (b, 1 / (b - a), 1 / (c - b)) clipped
+# at height h: a trapezoid made of a rising ramp, a plateau at h and a
+# falling ramp, each with a closed-form centroid
+@njit(cache=True, fastmath=True)
+def calc_individual(params, h):
+    b, left, right = params[0], 1.0 / params[1], 1.0 / params[2]
+    a = b - left
+    c = b + right
+    p = b - (1.0 - h) * left
+    q = b + (1.0 - h) * right
+
+    rise = h * (p - a) / 2.0
+    plateau = h * (q - p)
+    fall = h * (c - q) / 2.0
+    area = rise + plateau + fall
+    moment = (rise * (a + 2.0 * (p - a) / 3.0)
+              + plateau * (p + q) / 2.0
+              + fall * (q + (c - q) / 3.0))
+    return area, moment
+
+# Area and first moment of the intersection (pointwise min) of two clipped
+# triangles. Both are piecewise linear, so the min is integrated exactly
+# segment by segment between their vertices, splitting where they cross
+@njit(cache=True, fastmath=True)
+def calc_intersection(params1, h1, params2, h2):
+    lo = max(params1[0] - 1.0 / params1[1], params2[0] - 1.0 / params2[1])
+    hi = min(params1[0] + 1.0 / params1[2], params2[0] + 1.0 / params2[2])
+    if hi <= lo or h1 <= 0.0 or h2 <= 0.0:
+        return 0.0, 0.0
+
+    # Overlap bounds plus the interior vertices of both clipped triangles
+    knots = np.empty(10)
+    knots[0] = lo
+    knots[1] = hi
+    n = 2
+    for params, h in ((params1, h1), (params2, h2)):
+        b, left, right = params[0], 1.0 / params[1], 1.0 / params[2]
+        for x in (b - (1.0 - h) * left, b + (1.0 - h) * right):
+            if lo < x < hi:
+                knots[n] = x
+                n += 1
+    knots = np.sort(knots[:n])
+
+    area = 0.0
+    moment = 0.0
+    for i in range(n - 1):
+        x0 = knots[i]
+        x1 = knots[i + 1]
+        d0 = min(h1, tri(x0, params1)) - min(h2, tri(x0, params2))
+        d1 = min(h1, tri(x1, params1)) - min(h2, tri(x1, params2))
+        if d0 * d1 < 0.0:
+            xm = x0 + d0 / (d0 - d1) * (x1 - x0)
+            segments = ((x0, xm), (xm, x1))
+        else:
+            segments = ((x0, x1), (x1, x1))
+        for s0, s1 in segments:
+            y0 = min(h1, tri(s0, params1), h2, tri(s0, params2))
+            y1 = min(h1, tri(s1, params1), h2, tri(s1, params2))
+            area += (s1 - s0) * (y0 + y1) / 2.0
+            moment += (s1 - s0) * (s0 * (2.0 * y0 + y1) + s1 * (y0 + 2.0 * y1)) / 6.0
+    return area, moment
+
+# Defuzzify the union of the clipped consequents by centroid in closed form:
+# the union's area and moment are the sums over the individual clipped
+# triangles minus their pairwise intersections. This is exact as long as no
+# three terms overlap ('low' and 'high' are disjoint, checked at import)
+@njit(cache=True, fastmath=True)
+def centroid(cut_low, cut_medium, cut_high):
+    cuts = (cut_low, cut_medium, cut_high)
+    num = 0.0
+    den = 0.0
+    for i in range(3):
+        area, moment = calc_individual(cooling_params[i], cuts[i])
+        num += moment
+        den += area
+        for j in range(i + 1, 3):
+            area, moment = calc_intersection(cooling_params[i], cuts[i], cooling_params[j], cuts[j])
+            num -= moment
+            den -= area
+
+    # No rule fired (e.g. NaN inputs), so the centroid is undefined
+    if den <= 0.0:
+        return np.nan
+    return num / den
+
+# One end of the centroid interval of an interval type-2 fuzzy set sampled at
+# ascending x, by the enhanced Karnik-Mendel (EKM) iteration. Samples left of
+# the switch point k take w_left, the rest w_right; the left end puts the
+# upper membership on the left, the right end puts it on the right. Moving
+# the switch point only updates the sums over the samples that change side
+@njit(cache=True, fastmath=True)
+def _ekm_endpoint(x, mu_lower, mu_upper, right):
+    n = x.size
+    if right:
+        w_left, w_right, k = mu_lower, mu_upper, int(round(n / 1.7))
+    else:
+        w_left, w_right, k = mu_upper, mu_lower, int(round(n / 2.4))
+
+    a = 0.0
+    b = 0.0
+    for i in range(n):
+        w = w_left[i] if i < k else w_right[i]
+        a += x[i] * w
+        b += w
+    y = a / b
+
+    for _ in range(n):
+        # New switch point: the number of samples at or left of y
+        k_new = min(max(np.searchsorted(x, y, side='right'), 1), n - 1)
+        if k_new == k:
+            break
+        sign = 1.0 if k_new > k else -1.0
+        for i in range(min(k, k_new), max(k, k_new)):
+            d = w_left[i] - w_right[i]
+            a += sign * x[i] * d
+            b += sign * d
+        k = k_new
+        y = a / b
+    return y
+
+# Centroid of an interval type-2 fuzzy set sampled at ascending x: the
+# midpoint of its EKM centroid interval. With mu_lower == mu_upper (type-1)
+# both ends equal sum(x * mu) / sum(mu).
+#
+# Not used by the type-1 app yet; it is the defuzzifier for interval type-2
+# cooling sets, whose footprint of uncertainty is bounded by a lower and an
+# upper membership sampled on a shared universe, e.g.
+#
+#     x = np.linspace(0.0, 100.0, 201)
+#     upper = aggregated membership of the upper (wider) output sets
+#     lower = aggregated membership of the lower (narrower) output sets
+#     cooling_level = ekm_centroid(x, lower, upper)
+@njit(cache=True, fastmath=True)
+def ekm_centroid(x, mu_lower, mu_upper):
+    return (_ekm_endpoint(x, mu_lower, mu_upper, False)
+            + _ekm_endpoint(x, mu_lower, mu_upper, True)) / 2.0
+
+# Evaluate the fuzzy rules (Mamdani min/max) and defuzzify by centroid
+@njit(fastmath=True)
+def compute_cooling(temp, hum, occ):
+    cut_low, cut_medium, cut_high = fire(temp, hum, occ)
+    return centroid(cut_low, cut_medium, cut_high)
+
+# Evaluate the flattened input arrays into out with one compiled loop
+@njit(fastmath=True)
+def _compute_cooling_many(temp, hum, occ, out):
+    for i in range(out.size):
+        out[i] = compute_cooling(temp[i], hum[i], occ[i])
+    return out
+
+# Pay the JIT compile cost at import; fall back to plain Python if numba fails
+try:
+    compute_cooling(25.0, 50.0, 5.0)
+    _compute_cooling_many(np.array([25.0]), np.array([50.0]), np.array([5.0]), np.empty(1))
+except Exception:
+    tri = getattr(tri, 'py_func', tri)
+    fire = getattr(fire, 'py_func', fire)
+    calc_individual = getattr(calc_individual, 'py_func', calc_individual)
+    calc_intersection = getattr(calc_intersection, 'py_func', calc_intersection)
+    centroid = getattr(centroid, 'py_func', centroid)
+    _ekm_endpoint = getattr(_ekm_endpoint, 'py_func', _ekm_endpoint)
+    ekm_centroid = getattr(ekm_centroid, 'py_func', ekm_centroid)
+    compute_cooling = getattr(compute_cooling, 'py_func', compute_cooling)
+    _compute_cooling_many = getattr(_compute_cooling_many, 'py_func', _compute_cooling_many)
+
+def infer(temp, hum, occ):
+    return compute_cooling(float(temp), float(hum), float(occ))
+
+# Evaluate many inputs at once; the arguments broadcast against each other,
+# e.g. a temperature sweep at fixed humidity and occupancy
+def infer_batch(temp, hum, occ):
+    temp, hum, occ = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (temp, hum, occ)))
+    out = np.empty(temp.shape)
+    _compute_cooling_many(temp.ravel(), hum.ravel(), occ.ravel(), out.reshape(-1))
+    return out
+
+# Tabulate the cooling level over every slider combination (integer steps),
+# indexed by lut_index()
+def build_lut():
+    axes = [np.arange(lo, hi + 1) for _, (lo, hi), _, _, _ in input_variables]
+    temp, hum, occ = np.meshgrid(*axes, indexing='ij')
+    return infer_batch(temp, hum, occ).astype(np.float32)
+
+# Position of the slider values (temp, hum, occ) in the build_lut() table
+def lut_index(temp, hum, occ):
+    return tuple(v - lo for v, (_, (lo, _), _, _, _) in zip((temp, hum, occ), input_variables))